@@ -0,0 +1,114 @@
+import logging
+import os
+import random
+
+import boto3
+from botocore.config import Config
+
+try:
+    import orjson
+
+    # Constant halves of the {"response": ...} envelope; only the
+    # variable message is serialized per call.
+    _ENVELOPE_PFX = b'{"response":'
+    _ENVELOPE_SFX = b"}"
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+
+    def _envelope(message):
+        return (_ENVELOPE_PFX + orjson.dumps(message) +
+                _ENVELOPE_SFX).decode("utf-8")
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj)
+
+    def _envelope(message):
+        return json.dumps({"response": message})
+
+    def _loads(data):
+        return json.loads(data)
+
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Created once at import time so warm invocations in the same execution
+# context reuse the client instead of rebuilding it per request.
+_DDB = boto3.client(
+    "dynamodb",
+    config=Config(tcp_keepalive=True,
+                  retries={
+                      "mode": "standard",
+                      "max_attempts": 3
+                  },
+                  connect_timeout=1,
+                  read_timeout=2),
+)
+TABLE_NAME = os.environ["TABLE_NAME"]
+
+# The response headers never change, so build them once at import time
+# instead of allocating a fresh dict on every response; success and
+# error responses share the same set.
+_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Headers": "Content-Type",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
+    "Secret": "Writen by ChatGPT-3",
+}
+
+# Banter comments are constant; keep them in a module-level tuple and
+# bind random.choice locally so each call is a single lookup.
+_COMMENTS = (
+    "Debugging is like being a detective in a mystery movie where you're also the murderer.",
+    "Why do programmers prefer dark mode? Less bright light when staring at their screen for hours.",
+    "Debugging is like trying to find a needle in a haystack, except the needle is also made of hay.",
+    "Why do developers always mix up Halloween and Christmas? Because Oct 31 equals Dec 25.",
+    "Why was the JavaScript developer sad? He didn't know how to 'null'.",
+    "Why do programmers always mix up Thanksgiving and Christmas? Because Nov 25 equals Dec 25.",
+)
+_choice = random.choice
+
+
+def generate_response(status_code, message, data=None):
+    """Generates a consistent JSON response for the client.
+
+    Args:
+        status_code (int): the HTTP status code of the response
+        message (string): the message to be included in the response
+
+    Returns:
+        dict: the JSON response
+    """
+    try:
+        if not isinstance(status_code, int) or not 100 <= status_code <= 599:
+            raise ValueError("Invalid status code")
+        if not isinstance(message, dict):
+            raise ValueError("Invalid message")
+
+        response = {
+            "statusCode": status_code,
+            "body": _envelope(message),
+            "headers": _HEADERS,
+        }
+        return response
+    except ValueError as e:
+        return {
+            "statusCode": 400,
+            "body": _dumps({"error": str(e)}),
+            "headers": _HEADERS,
+        }
+
+
+def generate_banter_comment():
+    """Generates a random banter comment.
+
+    Returns:
+        string: a random banter comment
+    """
+    return _choice(_COMMENTS)
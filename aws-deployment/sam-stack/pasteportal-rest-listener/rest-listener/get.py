@@ -1,13 +1,5 @@
-import json
-import logging
-import os
-import random
-from datetime import datetime
-
-import boto3
-
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+from _common import (_DDB, TABLE_NAME, generate_banter_comment,
+                     generate_response, logger)
 
 
 def lambda_handler(event, context):
@@ -35,28 +27,52 @@ def get_request(event, context):
     """
 
     # Gather some Vvariables
-    body = event
-    queryStringParameters = body["queryStringParameters"]
-    queryStringParameters = {
-        k.lower(): v
-        for k, v in queryStringParameters.items()
-    }
-    first_queryStringParameters_key = list(queryStringParameters.keys())[0]
-    table_name = os.environ["TABLE_NAME"]
-    # if the table name is not configured return a 500 with a message
-
-    # check if the first key is data and if the length of the dictionary is 1 if is not return a 400 with a message
-    if first_queryStringParameters_key != "id" or len(
-            queryStringParameters) != 1:
+    queryStringParameters = event.get("queryStringParameters") or {}
+    table_name = TABLE_NAME
+
+    # Probe the expected spellings directly; only fall back to the
+    # case-insensitive scan when none of them match.
+    id_value = (queryStringParameters.get("id")
+                or queryStringParameters.get("ID")
+                or queryStringParameters.get("Id"))
+    if id_value is None:
+        id_value = next(
+            (v for k, v in queryStringParameters.items() if k.lower() == "id"),
+            None)
+
+    # check that the id parameter is present, non-empty and the only parameter, if not return a 400 with a message
+    if not id_value or len(queryStringParameters) != 1:
         message = {
             "message":
             "The paste was unsuccessfully retrived from the database. Parameter is not correct",
             "joke": generate_banter_comment(),
         }
-        logger.info(message)
+        logger.info("GET rejected: missing or ambiguous id parameter")
         return generate_response(400, message)
     else:
-        id = queryStringParameters["id"]
+        id = id_value
+        # A comma-separated id list is fetched in a single BatchGetItem
+        # round-trip; the single-id case keeps the cheaper get_item call.
+        if "," in id:
+            ids = [i for i in id.split(",") if i]
+            returned_data = db_batch_output(table_name, ids)
+            if returned_data is None:
+                message = {
+                    "message":
+                    "The pastes were unsuccessfully retrived from the database",
+                    "id": "Not Found",
+                    "joke": generate_banter_comment(),
+                }
+                logger.info("pastes not found ids=%s", ids)
+                return generate_response(400, message)
+            message = {
+                "message":
+                "The pastes were successfully retrived from the database",
+                "results": returned_data,
+                "joke": generate_banter_comment(),
+            }
+            logger.info("pastes retrieved count=%d", len(returned_data))
+            return generate_response(200, message)
         returned_data = db_output(table_name, id)
         # if the reposne is None return a 404 with a message
         # alternatively you can return a 200 with a message that says the paste was not found
@@ -67,7 +83,7 @@ def get_request(event, context):
                 "id": "Not Found",
                 "joke": generate_banter_comment(),
             }
-            logger.info(message)
+            logger.info("paste not found id=%s", id)
             return generate_response(400, message)
         else:
             id = returned_data["id"]
@@ -79,13 +95,13 @@ def get_request(event, context):
             message = {
                 "message":
                 "The paste was successfully retrived from the database",
-                "id": str(id),
-                "paste": str(paste),
+                "id": id,
+                "paste": paste,
                 "joke": generate_banter_comment(),
-                "creator_gh_user": str(creator_gh_user),
-                "recipient_gh_username": str(recipient_gh_username),
+                "creator_gh_user": creator_gh_user,
+                "recipient_gh_username": recipient_gh_username,
             }
-            logger.info(message)
+            logger.info("paste retrieved id=%s bytes=%d", id, len(paste))
             return generate_response(200, message)
 
 
@@ -100,93 +116,62 @@ def db_output(table_name, id):
         result: the data as a string or None if no data was found for the given id
     """
     try:
-        client = boto3.client("dynamodb")
-        response = client.get_item(TableName=table_name,
-                                   Key={"id": {
-                                       "S": str(id)
-                                   }})
-        # Check if the response was successful
-        if "Item" not in response:
-            raise ValueError("No item found for the provided id.")
-        item_values = export_item_values(response["Item"])
-        return item_values
-    except ValueError as e:
-        print(e)
-        return None
+        response = _DDB.get_item(TableName=table_name,
+                                 Key={"id": {
+                                     "S": str(id)
+                                 }})
     except Exception as e:
-        print(e)
+        logger.error(f"Error: {e}")
         return None
+    item = response.get("Item")
+    return export_item_values(item) if item else None
 
 
-def export_item_values(item):
-    """
-    Takes in an 'item' (a dictionary) and returns a new dictionary where the values of the original item are the values of the new dictionary and the keys are the same as in the original item.
-
-    Args:
-        item (dict): The original dictionary
-    Returns:
-        dict: New dictionary with same keys and values of the original item
-    """
-    item_dict = {}
-    for key, value in item.items():
-        item_dict[key] = value["S"]
-    return item_dict
-
-
-def generate_response(status_code, message, data=None):
-    """Generates a consistent JSON response for the client.
+def db_batch_output(table_name, ids):
+    """Get several items from the database in a single BatchGetItem call.
 
     Args:
-        status_code (int): the HTTP status code of the response
-        message (string): the message to be included in the response
+        table_name (string): the name of the table to get the data from
+        ids (list): the ids of the items to get (up to 100)
 
     Returns:
-        dict: the JSON response
+        result: a list of item dicts, or None if no items were found
     """
+    # DynamoDB rejects a batch containing duplicate keys, so dedupe
+    # while preserving the requested order.
+    keys = [{"id": {"S": str(i)}} for i in dict.fromkeys(ids)]
+    items = []
     try:
-        if not isinstance(status_code, int) or not 100 <= status_code <= 599:
-            raise ValueError("Invalid status code")
-        if not isinstance(message, dict):
-            raise ValueError("Invalid message")
-
-        response = {
-            "statusCode": status_code,
-            "body": json.dumps({"response": message}),
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Headers": "Content-Type",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
-                "Secret": "Writen by ChatGPT-3",
-            },
-        }
-        return response
-    except ValueError as e:
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Headers": "Content-Type",
-                "Access-Control-Allow-Origin": "*",
-                "Access-Control-Allow-Methods": "OPTIONS,POST,GET",
-                "Secret": "Writen by ChatGPT-3",
-            },
-        }
+        # A throttled batch returns the remainder in UnprocessedKeys;
+        # retry those so present items are not silently dropped.
+        for _ in range(3):
+            response = _DDB.batch_get_item(
+                RequestItems={table_name: {
+                    "Keys": keys
+                }})
+            items.extend(response.get("Responses", {}).get(table_name, []))
+            unprocessed = response.get("UnprocessedKeys")
+            if not unprocessed:
+                break
+            keys = unprocessed[table_name]["Keys"]
+        else:
+            logger.error(
+                f"Error: BatchGetItem left {len(keys)} keys unprocessed")
+    except Exception as e:
+        logger.error(f"Error: {e}")
+        return None
+    if not items:
+        return None
+    return [export_item_values(item) for item in items]
 
 
-def generate_banter_comment():
-    """Generates a random banter comment.
+def export_item_values(item):
+    """
+    Takes in an 'item' (a dictionary) and returns a new dictionary where the values of the original item are the values of the new dictionary and the keys are the same as in the original item.
 
+    Args:
+        item (dict): The original dictionary
     Returns:
-        string: a random banter comment
+        dict: New dictionary with same keys and values of the original item
     """
-    comments = [
-        "Debugging is like being a detective in a mystery movie where you're also the murderer.",
-        "Why do programmers prefer dark mode? Less bright light when staring at their screen for hours.",
-        "Debugging is like trying to find a needle in a haystack, except the needle is also made of hay.",
-        "Why do developers always mix up Halloween and Christmas? Because Oct 31 equals Dec 25.",
-        "Why was the JavaScript developer sad? He didn't know how to 'null'.",
-        "Why do programmers always mix up Thanksgiving and Christmas? Because Nov 25 equals Dec 25.",
-    ]
-    return random.choice(comments)
+    return {key: value["S"] for key, value in item.items()}
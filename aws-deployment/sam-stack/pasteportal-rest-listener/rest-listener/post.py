@@ -1,14 +1,15 @@
-import json
-import logging
-import os
-import random
-import sys
+import secrets
 from datetime import datetime
 
-import boto3
+from _common import (_DDB, TABLE_NAME, _loads, generate_banter_comment,
+                     generate_response, logger)
 
-logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+# Fields every POST body must carry, checked as one set-containment op.
+_REQUIRED_FIELDS = frozenset({"paste", "creator_gh_user", "recipient_gh_username"})
+# Bound once so the hot path skips the attribute lookups on datetime.
+_utcnow = datetime.utcnow
+# DynamoDB item size limit in bytes.
+_SIZE_LIMIT = 400 * 1024
 
 
 def lambda_handler(event, context):
@@ -37,17 +38,29 @@ def post_request(event, context):
 
     try:
         # Generates the id and timestamp
-        id = hex(random.randint(0, 16777215))[2:].zfill(6)
-        now = datetime.now()
-        timestamp = now.isoformat()
+        id = secrets.token_hex(3)
+        timestamp = _utcnow().isoformat()
         body = event["body"]
-        table = os.environ["TABLE_NAME"]
-        json_body = json.loads(body)
-        if (("paste" not in json_body) or ("creator_gh_user" not in json_body)
-                or ("recipient_gh_username" not in json_body)):
+        table = TABLE_NAME
+        # Reject oversized payloads before paying the JSON parse cost;
+        # parse time is O(n) in the body length.
+        if body is not None and check_data_size(body):
+            return generate_response(
+                413,
+                {
+                    "message":
+                    "That was a big one. Try to send a smaller one just in case.",
+                    "joke": generate_banter_comment(),
+                },
+            )
+        json_body = _loads(body)
+        if not _REQUIRED_FIELDS <= json_body.keys():
             return generate_response(
                 400,
-                "Missing required fields: paste, creator_gh_user, recipient_gh_username",
+                {
+                    "message":
+                    "Missing required fields: paste, creator_gh_user, recipient_gh_username"
+                },
             )
         paste = json_body["paste"]
         creator_gh_user = json_body["creator_gh_user"]
@@ -57,10 +70,10 @@ def post_request(event, context):
                  recipient_gh_username)
         message = {
             "message": "The paste was successfully inserted into the database",
-            "id": str(id),
-            "timestamp": str(timestamp),
-            "raw_data": str(body),
-            "paste": str(paste),
+            "id": id,
+            "timestamp": timestamp,
+            "raw_data": body,
+            "paste": paste,
             "joke": generate_banter_comment(),
         }
         return generate_response(200, message)
@@ -74,41 +87,22 @@ def post_request(event, context):
 def db_input(table_name, id, paste, timestamp, creator_gh_user,
              recipient_gh_username):
     """
-    Insert data into the DynamoDB table with the given id and timestamp or generate a random id and timestamp if none are provided.
-    The function also validate the table name and handle specific exception if table not found,
+    Insert data into the DynamoDB table with the given id and timestamp.
+    The function handles the specific exception if the table is not found,
     and log the status of the function using AWS CloudWatch compatible logging.
 
     Args:
         table_name (str): The name of the DynamoDB table to insert the data into.
-        id (str): The unique identifier of the data to insert. If not provided, a random id will be generated.
+        id (str): The unique identifier of the data to insert.
         paste (str): The data to insert into the DynamoDB table.
-        timestamp (str): The timestamp of the data to insert into the DynamoDB table. If not provided, the current timestamp will be used.
+        timestamp (str): The timestamp of the data to insert into the DynamoDB table.
         creator_gh_user (str): The username of the creator of the data.
         recipient_gh_username (str): The username of the recipient of the data.
     Returns:
         bool: True if the data was inserted successfully, False otherwise.
     """
     try:
-        print("Inserting data into the table")
-        print("Table name: ", table_name)
-        print("Id: ", id)
-        print("Paste: ", paste)
-        print("Timestamp: ", timestamp)
-        print("Creator GitHub Username: ", creator_gh_user)
-        print("Recipient GitHub Username: ", recipient_gh_username)
-
-        client = boto3.client("dynamodb")
-
-        if id is None:
-            id = hex(random.randint(0, 16777215))[2:].zfill(6)
-        if timestamp is None:
-            now = datetime.now()
-            timestamp = now.isoformat()
-        if table_name is None:
-            table_name = os.environ["TABLE_NAME"]
-        if paste is not None:
-            paste = paste.replace("'", "''")
-        dynamodb_data = client.put_item(
+        dynamodb_data = _DDB.put_item(
             TableName=str(table_name),
             Item={
                 "id": {
@@ -128,22 +122,13 @@ def db_input(table_name, id, paste, timestamp, creator_gh_user,
                 },
             },
         )
-        print("DynamoDB response: ", dynamodb_data)
-        print("DynamoDB response metadata: ",
-              dynamodb_data["ResponseMetadata"])
-        print(
-            "DynamoDB response metadata HTTP status code: ",
-            dynamodb_data["ResponseMetadata"]["HTTPStatusCode"],
-        )
-
         if ("ResponseMetadata" in dynamodb_data and
                 dynamodb_data["ResponseMetadata"]["HTTPStatusCode"] == 200):
-            print("Record inserted successfully")
             return True
         else:
-            print("Error: Could not insert record in DynamoDB")
+            logger.error("Error: Could not insert record in DynamoDB")
             return False
-    except client.exceptions.ResourceNotFoundException as e:
+    except _DDB.exceptions.ResourceNotFoundException as e:
         logger.error(f"Error: The table {table_name} was not found.")
         logger.error(f"Error: {e}")
         return False
@@ -152,24 +137,6 @@ def db_input(table_name, id, paste, timestamp, creator_gh_user,
         return False
 
 
-def generate_banter_comment():
-    """Generates a random banter comment.
-
-    Returns:
-        string: a random banter comment
-    """
-
-    comments = [
-        "Debugging is like being a detective in a mystery movie where you're also the murderer.",
-        "Why do programmers prefer dark mode? Less bright light when staring at their screen for hours.",
-        "Debugging is like trying to find a needle in a haystack, except the needle is also made of hay.",
-        "Why do developers always mix up Halloween and Christmas? Because Oct 31 equals Dec 25.",
-        "Why was the JavaScript developer sad? He didn't know how to 'null'.",
-        "Why do programmers always mix up Thanksgiving and Christmas? Because Nov 25 equals Dec 25.",
-    ]
-    return random.choice(comments)
-
-
 def check_data_size(data):
     """Checks the size of the data to ensure it is bellow 400kb which is the limit for DynamoDB
 
@@ -177,68 +144,13 @@ def check_data_size(data):
         data (string): Incoming data
 
     Returns:
-        String: JSon Return
+        bool: True if the data exceeds the limit, False otherwise
     """
 
-    # Size limit in bytes
-    size_limit = 400 * 1024
-
-    # Check if the data is larger than the size limit
-    if sys.getsizeof(data) > size_limit:
-        print("Size is not within the limit" + str(sys.getsizeof(data)))
-        return {
-            "statusCode":
-            500,
-            "body":
-            json.dumps({
-                "message":
-                "That was a big one. Try to send a smaller one just in case.",
-                "joke": generate_banter_comment(),
-            }),
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-            },
-        }
-        # exit compltely
-
-    else:
-        print("Data size is within limit:" + str(sys.getsizeof(data)))
-
-
-def generate_response(status_code, message, data=None):
-    """Generates a consistent JSON response for the client.
-
-    Args:
-        status_code (int): the HTTP status code of the response
-        message (string): the message to be included in the response
-
-    Returns:
-        dict: the JSON response
-    """
-    try:
-        if not isinstance(status_code, int) or not 100 <= status_code <= 599:
-            raise ValueError("Invalid status code")
-        if not isinstance(message, dict):
-            raise ValueError("Invalid message")
-
-        response = {
-            "statusCode": status_code,
-            "body": json.dumps({"response": message}),
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Secret": "Writen by ChatGPT-3",
-            },
-        }
-        return response
-    except ValueError as e:
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": str(e)}),
-            "headers": {
-                "Content-Type": "application/json",
-                "Access-Control-Allow-Origin": "*",
-                "Secret": "Writen by ChatGPT-3",
-            },
-        }
+    # len() on the encoded payload is the actual on-the-wire size;
+    # sys.getsizeof would include Python object overhead.
+    encoded = data.encode("utf-8") if isinstance(data, str) else data
+    if len(encoded) > _SIZE_LIMIT:
+        logger.info("Size is not within the limit: %d", len(encoded))
+        return True
+    return False
@@ -1,7 +1,16 @@
-import json
-
 import boto3
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    import json
+
+    def _dumps(obj):
+        return json.dumps(obj)
+
 client = boto3.client("dynamodb")
 
 
@@ -12,7 +21,7 @@ def lambda_handler(event, context):
 
     response = {
         "statusCode": 200,
-        "body": json.dumps(data),
+        "body": _dumps(data),
         "headers": {
             "Content-Type": "application/json",
             "Access-Control-Allow-Origin": "*",